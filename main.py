@@ -1,11 +1,21 @@
 import argparse
+import functools
 import os
 import shutil
+import subprocess
 import sys
 import time
 import re
 import imaplib
-import email as py_email
+from email import message_from_bytes
+from email.parser import BytesHeaderParser
+import queue
+import select
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
 
 from selenium import webdriver
@@ -21,41 +31,313 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.keys import Keys
 
-try:
-	# Optional dependency, used as fallback when local PATH chromedriver is incompatible
-	from webdriver_manager.chrome import ChromeDriverManager
-except Exception:  # pragma: no cover - remain optional until used
-	ChromeDriverManager = None
+@dataclass(frozen=True)
+class Timeouts:
+	"""Per-step wait budgets in seconds, tighter than the global --timeout.
 
+	A single missing element should fail within its own budget instead of
+	burning the full global timeout once per probe.
+	"""
+
+	popup: int = 2
+	field: int = 8
+	submit: int = 8
+	profile: int = 12
+
+
+TIMEOUTS = Timeouts()
+
+
+# Candidate locators, compiled once at import time; ordered most to least
+# specific. Functions reference these instead of rebuilding the lists per call.
+LOGIN_LOCATORS = (
+	(By.ID, "login_Layer"),
+	(By.CSS_SELECTOR, "a#login_Layer"),
+	(By.CSS_SELECTOR, "a[title='Jobseeker Login']"),
+	(By.XPATH, "//a[@id='login_Layer' or @title='Jobseeker Login' or contains(@class,'nI-gNb-lg-rg__login')]"),
+)
+EMAIL_LOCATORS = (
+	(By.CSS_SELECTOR, "input[type='email']"),
+	(By.CSS_SELECTOR, "input[id*='email' i]"),
+	(By.CSS_SELECTOR, "input[name*='email' i]"),
+	(By.CSS_SELECTOR, "input[placeholder*='Email' i]"),
+	(By.CSS_SELECTOR, "input[placeholder*='Username' i]"),
+	(By.ID, "usernameField"),
+)
+PASSWORD_LOCATORS = (
+	(By.CSS_SELECTOR, "input[type='password']"),
+	(By.CSS_SELECTOR, "input[id*='pass' i]"),
+	(By.CSS_SELECTOR, "input[name*='pass' i]"),
+	(By.CSS_SELECTOR, "input[placeholder*='password' i]"),
+	(By.ID, "passwordField"),
+)
+SUBMIT_LOCATORS = (
+	(By.CSS_SELECTOR, "button.btn-primary.loginButton"),
+	(By.CSS_SELECTOR, "button.loginButton"),
+	(By.XPATH, "//button[@type='submit' and contains(@class,'loginButton')]"),
+	(By.XPATH, "//button[contains(., 'Login') or contains(., 'Log In')]"),
+	(By.CSS_SELECTOR, "input[type='submit']"),
+)
+PROFILE_LOCATORS = (
+	(By.XPATH, "//a[normalize-space()='View profile']"),
+	(By.CSS_SELECTOR, "a[href='/mnjuser/profile']"),
+	(By.XPATH, "//a[contains(@href, '/mnjuser/profile')]"),
+)
+EDIT_LOCATORS = (
+	(By.XPATH, "//em[contains(@class,'icon') and contains(@class,'edit') and contains(normalize-space(.), 'editOneTheme')]"),
+	(By.CSS_SELECTOR, "em.icon.edit"),
+)
+SAVE_LOCATORS = (
+	(By.ID, "saveBasicDetailsBtn"),
+	(By.CSS_SELECTOR, "#saveBasicDetailsBtn"),
+	(By.CSS_SELECTOR, "button#saveBasicDetailsBtn.btn-dark-ot"),
+	(By.XPATH, "//button[@id='saveBasicDetailsBtn' or (contains(@class,'btn-dark-ot') and (normalize-space(.)='Save' or contains(@aria-label,'Save')))]"),
+)
+
+# Pre-joined CSS unions so a single querySelector call can replace a loop
+EMAIL_CSS = ", ".join(sel for by, sel in EMAIL_LOCATORS if by == By.CSS_SELECTOR)
+PASSWORD_CSS = ", ".join(sel for by, sel in PASSWORD_LOCATORS if by == By.CSS_SELECTOR)
+
+
+# Resolved chromedriver path, memoized per process and persisted across runs
+_DRIVER_PATH_CACHE: str | None = None
+_DRIVER_PATH_FILE = Path.home() / ".cache" / "naukri-automation" / "driver_path"
+
+
+def _lazy_wdm():
+	"""Import webdriver_manager only when the fallback path actually needs it.
+
+	The import drags in requests/TLS setup (~50-200ms); the happy path never
+	pays it. Returns the ChromeDriverManager class, or None if not installed.
+	"""
+	try:
+		# Optional dependency, used as fallback when local PATH chromedriver is incompatible
+		from webdriver_manager.chrome import ChromeDriverManager
+	except Exception:  # pragma: no cover - remain optional until used
+		return None
+	return ChromeDriverManager
+
+
+def _installed_chrome_version() -> str:
+	"""Best-effort detection of the installed Chrome/Chromium version string."""
+	candidates = [
+		"google-chrome",
+		"google-chrome-stable",
+		"chromium-browser",
+		"chromium",
+		"/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+	]
+	for binary in candidates:
+		path = shutil.which(binary) if os.sep not in binary else (binary if os.path.exists(binary) else None)
+		if not path:
+			continue
+		try:
+			out = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=5)
+		except (OSError, subprocess.SubprocessError):
+			continue
+		if out.returncode == 0 and out.stdout.strip():
+			return out.stdout.strip()
+	return ""
 
+
+def _resolve_driver_path() -> str:
+	"""Resolve the chromedriver path once, skipping repeated version lookups.
+
+	ChromeDriverManager().install() performs an HTTP version check on every
+	call. Memoize the result in-process, and persist it keyed by the installed
+	Chrome version so subsequent processes skip install() entirely.
+	"""
+	global _DRIVER_PATH_CACHE
+	if _DRIVER_PATH_CACHE:
+		return _DRIVER_PATH_CACHE
+
+	chrome_version = _installed_chrome_version()
+	try:
+		key, _, cached_path = _DRIVER_PATH_FILE.read_text().partition("\n")
+		cached_path = cached_path.strip()
+		if chrome_version and key == chrome_version and os.path.exists(cached_path):
+			_DRIVER_PATH_CACHE = cached_path
+			return _DRIVER_PATH_CACHE
+	except OSError:
+		pass
+
+	manager_cls = _lazy_wdm()
+	if manager_cls is None:
+		raise RuntimeError("webdriver-manager is not installed and no cached driver path exists")
+	_DRIVER_PATH_CACHE = manager_cls().install()
+	try:
+		_DRIVER_PATH_FILE.parent.mkdir(parents=True, exist_ok=True)
+		_DRIVER_PATH_FILE.write_text(f"{chrome_version}\n{_DRIVER_PATH_CACHE}\n")
+	except OSError:
+		pass
+	return _DRIVER_PATH_CACHE
+
+
+@functools.lru_cache(maxsize=1)
+def _resolved_driver_dir() -> str | None:
+	"""Resolve the directory of any chromedriver on PATH, once per process."""
+	chromedriver_path = shutil.which("chromedriver")
+	if not chromedriver_path:
+		return None
+	return os.path.dirname(os.path.realpath(chromedriver_path))
+
+
+@functools.lru_cache(maxsize=1)
 def _hide_chromedriver_from_path():
 	"""If an incompatible chromedriver is on PATH, hide it for this process.
 
 	Selenium Manager works best when it can resolve the driver itself. If a
 	chromedriver binary is present on PATH (e.g., via Homebrew) and is
 	incompatible with the local Chrome version, Selenium may try to use it
-	and fail. We remove that directory from PATH for this process.
+	and fail. We remove that directory from PATH for this process. Cached so
+	pooled launches only scrub PATH once.
 	"""
-	chromedriver_path = shutil.which("chromedriver")
-	if not chromedriver_path:
+	driver_dir = _resolved_driver_dir()
+	if not driver_dir:
 		return
-	driver_dir = os.path.dirname(os.path.realpath(chromedriver_path))
 	path_entries = os.environ.get("PATH", "").split(os.pathsep)
 	new_entries = [p for p in path_entries if os.path.realpath(p) != driver_dir]
 	if len(new_entries) != len(path_entries):
 		os.environ["PATH"] = os.pathsep.join(new_entries)
 
 
-def get_chrome_driver(headless: bool = True) -> webdriver.Chrome:
+# Lean-launch flags: without these, headless Chrome still loads extensions,
+# sync, translate, default apps and background networking, which dominate
+# cold-start and first-paint cost.
+_LEAN_CHROME_FLAGS = (
+	"--disable-extensions",
+	"--disable-background-networking",
+	"--disable-default-apps",
+	"--disable-sync",
+	"--disable-translate",
+	"--disable-renderer-backgrounding",
+	"--disable-backgrounding-occluded-windows",
+	"--disable-client-side-phishing-detection",
+	"--disable-component-update",
+	"--metrics-recording-only",
+	"--mute-audio",
+	"--no-first-run",
+	"--no-default-browser-check",
+	"--disable-features=Translate,BackForwardCache,OptimizationHints",
+)
+
+
+# Resource patterns never needed by the login/profile-save flow; blocking them
+# cuts page weight dramatically on naukri.com (images, fonts, ads, trackers).
+_BLOCKED_URL_PATTERNS = [
+	"*.png",
+	"*.jpg",
+	"*.jpeg",
+	"*.gif",
+	"*.webp",
+	"*.svg",
+	"*.mp4",
+	"*.woff",
+	"*.woff2",
+	"*google-analytics*",
+	"*googletagmanager*",
+	"*doubleclick*",
+	"*clevertap*",
+]
+
+
+# Hardening payload registered before any document loads; all fingerprint
+# patches are batched into one CDP call instead of one per property.
+_HARDEN_JS = (
+	"Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+	"Object.defineProperty(navigator, 'languages', {get: () => ['en-IN', 'en']});"
+	"Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3]});"
+)
+
+
+def _harden(driver):
+	"""Patch automation fingerprints before any page loads; best-effort.
+
+	Uses Page.addScriptToEvaluateOnNewDocument so the patches are installed
+	ahead of the first document, avoiding a race with early page scripts.
+	Returns the driver for chaining.
+	"""
+	try:
+		driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _HARDEN_JS})
+	except Exception:
+		pass
+	return driver
+
+
+def _widen_command_pool(driver) -> None:
+	"""Let WebDriver commands share a warm, wider HTTP pool to chromedriver.
+
+	selenium's RemoteConnection builds its urllib3 PoolManager with
+	maxsize=1, which serialises every command over a single socket and
+	forces TCP setup whenever commands overlap (the IMAP worker thread can
+	now issue calls concurrently with the main flow). Rebuild the pool with
+	the same settings but room for concurrent connections. Best-effort: the
+	private attribute layout varies across selenium 4.x releases.
+	"""
+	try:
+		import urllib3
+
+		conn = getattr(driver.command_executor, "_conn", None)
+		if conn is None:
+			return
+		kw = dict(getattr(conn, "connection_pool_kw", None) or {})
+		kw.update({"maxsize": 10, "block": False})
+		driver.command_executor._conn = urllib3.PoolManager(**kw)
+	except Exception:
+		pass
+
+
+def _block_heavy_resources(driver) -> None:
+	"""Block image/font/analytics requests over CDP; best-effort (Chrome only)."""
+	try:
+		driver.execute_cdp_cmd("Network.enable", {})
+		driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+	except Exception:
+		pass
+
+
+def get_chrome_driver(
+	headless: bool = True,
+	page_load_strategy: str = "eager",
+	user_data_dir: str | None = None,
+	attach: str | None = None,
+	block_images: bool = True,
+	block_media: bool = True,
+) -> webdriver.Chrome:
 	"""Create and return a Chrome WebDriver using Selenium Manager (no manual driver downloads).
 
 	Args:
 		headless: Run Chrome in headless mode (recommended for CI/servers).
+		page_load_strategy: W3C pageLoadStrategy; "eager" makes driver.get()
+			return on DOMContentLoaded instead of waiting for every ad/tracker
+			to finish loading. Explicit waits downstream guarantee correctness.
+		block_images: disable image loading (the flow needs none); pass False
+			when screenshots must capture full visual state.
+		block_media: block image/font/video/tracker requests at the network
+			layer via CDP; pass False alongside block_images=False when a
+			visually complete page matters.
+		user_data_dir: persistent Chrome profile dir; cookies/session survive
+			across runs, letting warm runs skip the whole OTP flow.
+		attach: "host:port" of an already-running Chrome started with
+			--remote-debugging-port; attaching reuses that browser and skips
+			the launch cost entirely.
 
 	Returns:
 		A configured Chrome WebDriver instance.
 	"""
+	if attach:
+		# Attach to an existing browser; launch flags do not apply to it
+		options = webdriver.ChromeOptions()
+		options.page_load_strategy = page_load_strategy
+		options.add_experimental_option("debuggerAddress", attach)
+		driver = webdriver.Chrome(options=options)
+		_widen_command_pool(driver)
+		return driver
+
 	options = webdriver.ChromeOptions()
+	options.page_load_strategy = page_load_strategy
+	if user_data_dir:
+		options.add_argument(f"--user-data-dir={user_data_dir}")
 	if headless:
 		# new headless is more compatible with real browser behavior
 		options.add_argument("--headless=new")
@@ -64,6 +346,8 @@ def get_chrome_driver(headless: bool = True) -> webdriver.Chrome:
 	options.add_argument("--disable-dev-shm-usage")
 	options.add_argument("--disable-gpu")
 	options.add_argument("--window-size=1366,900")
+	for flag in _LEAN_CHROME_FLAGS:
+		options.add_argument(flag)
 	# Reduce automation fingerprints
 	options.add_experimental_option("excludeSwitches", ["enable-automation"])
 	options.add_experimental_option("useAutomationExtension", False)
@@ -72,37 +356,274 @@ def get_chrome_driver(headless: bool = True) -> webdriver.Chrome:
 	options.add_argument(
 		"--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 	)
-
-	# Prefer webdriver-manager to avoid PATH chromedriver conflicts entirely
-	if ChromeDriverManager is not None:
-		driver_path = ChromeDriverManager().install()
-		service = ChromeService(executable_path=driver_path)
+	# The flow only touches the login form and a save button; skip images and
+	# suppress the notification prompt (kills the CleverTap push popup too)
+	prefs = {"profile.default_content_setting_values.notifications": 2}
+	if block_images:
+		prefs["profile.managed_default_content_settings.images"] = 2
+		options.add_argument("--blink-settings=imagesEnabled=false")
+	options.add_experimental_option("prefs", prefs)
+
+	# Prefer Selenium Manager (bundled since 4.6): it resolves the driver from
+	# its local cache with no HTTP version lookup. Clean PATH first so an
+	# incompatible Homebrew chromedriver can't shadow it.
+	_hide_chromedriver_from_path()
+	try:
+		driver = webdriver.Chrome(options=options)
+	except SessionNotCreatedException:
+		# Fallback: let webdriver-manager fetch a matching driver
+		if _lazy_wdm() is None:
+			raise
+		service = ChromeService(executable_path=_resolve_driver_path())
 		driver = webdriver.Chrome(service=service, options=options)
-		# Patch navigator.webdriver and other properties early
+	_widen_command_pool(driver)
+	if block_media:
+		_block_heavy_resources(driver)
+	return _harden(driver)
+
+
+# Runs entirely in-page: probes every candidate selector in one script call
+# instead of one WebDriver round-trip per locator.
+_FIND_FIRST_JS = (
+	"for (const [kind, sel] of arguments[0]) {"
+	" let el = null;"
+	" try {"
+	"  el = kind === 'xpath'"
+	"   ? document.evaluate(sel, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue"
+	"   : document.querySelector(sel);"
+	" } catch (e) {}"
+	" if (el) return el;"
+	"} return null;"
+)
+
+
+def _as_js_locator(by, value):
+	"""Translate a Selenium (By, value) locator into a [kind, selector] pair for _FIND_FIRST_JS."""
+	if by == By.XPATH:
+		return ["xpath", value]
+	if by == By.ID:
+		return ["css", f"#{value}"]
+	if by == By.NAME:
+		return ["css", f"[name='{value}']"]
+	# CSS_SELECTOR and TAG_NAME are both valid querySelector input
+	return ["css", value]
+
+
+def _find_first(driver, locators):
+	"""Return the first element matching any locator, in one WebDriver round-trip.
+
+	Coalesces all candidate selectors into a single execute_script call so an
+	N-selector probe costs 1 command instead of N.
+	"""
+	batched = [_as_js_locator(by, value) for by, value in locators]
+	return driver.execute_script(_FIND_FIRST_JS, batched)
+
+
+# In-page presence wait: resolves the moment a MutationObserver sees the
+# selector appear, instead of a WebDriver round-trip per poll tick.
+_WAIT_SELECTOR_JS = (
+	"const sel = arguments[0], timeoutMs = arguments[1], cb = arguments[2];"
+	"if (document.querySelector(sel)) { cb(true); return; }"
+	"const obs = new MutationObserver(() => {"
+	" if (document.querySelector(sel)) { obs.disconnect(); cb(true); }"
+	"});"
+	"obs.observe(document.documentElement, {childList: true, subtree: true});"
+	"setTimeout(() => { obs.disconnect(); cb(false); }, timeoutMs);"
+)
+
+
+def _wait_for_selector_cdp(driver, css: str, timeout: int) -> bool:
+	"""Wait for a CSS selector to appear, firing on the first DOM mutation.
+
+	One execute_async_script call replaces up to timeout/poll_frequency
+	find_element round-trips. Presence only — use the EC waits when
+	visibility or clickability semantics matter. Returns True when the
+	selector matched, False on timeout; falls back to polling if the async
+	script dies (e.g. a navigation tears down the page mid-wait).
+	"""
+	try:
+		driver.set_script_timeout(timeout + 2)
+		return bool(driver.execute_async_script(_WAIT_SELECTOR_JS, css, int(timeout * 1000)))
+	except WebDriverException:
+		return _poll_first(driver, [(By.CSS_SELECTOR, css)], timeout) is not None
+
+
+def _first_present(driver, locators):
+	"""Zero-wait probe: return the first already-rendered match, else None.
+
+	One in-page sweep over every locator; used before falling into a waited
+	retry so an already-rendered DOM never pays a polling interval.
+	"""
+	try:
+		return _find_first(driver, locators)
+	except WebDriverException:
+		return None
+
+
+def _poll_first(driver, locators, timeout: int):
+	"""Poll _find_first until any locator matches; return the element or None on timeout."""
+	try:
+		return _wait(driver, timeout).until(lambda d: _find_first(d, locators))
+	except TimeoutException:
+		return None
+
+
+# Clicks every known cookie/consent control in one round-trip; runs entirely
+# in-page so the usual 6 find_element probes collapse into one script call.
+_DISMISS_POPUPS_JS = (
+	"const sels = ['#onetrust-accept-btn-handler', 'button#onetrust-accept-btn-handler'];"
+	"const xps = ["
+	" \"//button[contains(., 'Accept')]\","
+	" \"//button[contains(., 'Got it') or contains(., 'GOT IT')]\""
+	"];"
+	"sels.forEach(s => { const e = document.querySelector(s); if (e) e.click(); });"
+	"xps.forEach(x => {"
+	" const r = document.evaluate(x, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;"
+	" if (r) r.click();"
+	"});"
+)
+
+
+def _dismiss_popups(driver) -> None:
+	"""Dismiss cookie banners and consent prompts in a single in-page sweep."""
+	try:
+		driver.execute_script(_DISMISS_POPUPS_JS)
+	except WebDriverException:
+		pass
+
+
+# Screenshot capture is a debugging aid only; each shot is a full CDP
+# Page.captureScreenshot + PNG encode + disk write. Modes:
+#   off      — never capture
+#   on-error — no IO on the happy path; one shot of the failure state when
+#              an exception propagates (default)
+#   always   — capture every step, handing PNG bytes to a background writer
+#              thread so the flow never blocks on disk
+_SCREENSHOTS_DIR = Path("screenshots")
+_SCREENSHOTS_MODE = "on-error"
+_PENDING_SHOTS: list[str] = []
+_SHOT_QUEUE: "queue.Queue | None" = None
+
+
+def _shot_writer(q: queue.Queue) -> None:
+	"""Drain (path, png_bytes) items to disk; a None item shuts the writer down."""
+	while True:
+		item = q.get()
+		if item is None:
+			return
+		path, png = item
 		try:
-			driver.execute_cdp_cmd(
-				"Page.addScriptToEvaluateOnNewDocument",
-				{"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"},
-			)
-		except Exception:
+			path.write_bytes(png)
+		except OSError:
 			pass
-		return driver
 
-	# Fallback: try Selenium Manager with PATH cleaned
-	_hide_chromedriver_from_path()
+
+_SHOT_THREAD: "threading.Thread | None" = None
+
+
+def _start_shot_writer() -> None:
+	global _SHOT_QUEUE, _SHOT_THREAD
+	_SHOT_QUEUE = queue.Queue()
+	_SHOT_THREAD = threading.Thread(target=_shot_writer, args=(_SHOT_QUEUE,), daemon=True)
+	_SHOT_THREAD.start()
+
+
+def _drain_shot_writer() -> None:
+	"""Flush any queued screenshots before the process exits."""
+	if _SHOT_QUEUE is not None and _SHOT_THREAD is not None:
+		_SHOT_QUEUE.put(None)
+		_SHOT_THREAD.join(timeout=5)
+
+
+def _save_screenshot(driver, name: str) -> None:
+	"""Record a proof screenshot for this step, per the configured mode."""
+	if _SCREENSHOTS_MODE == "off":
+		return
+	if _SCREENSHOTS_MODE == "on-error":
+		# Happy path stays IO-free; remember the step so a failure dump can
+		# show how far the run got
+		_PENDING_SHOTS.append(name)
+		return
 	try:
-		driver = webdriver.Chrome(options=options)
+		png = driver.get_screenshot_as_png()
+	except WebDriverException:
+		return
+	if _SHOT_QUEUE is not None:
+		_SHOT_QUEUE.put((_SCREENSHOTS_DIR / name, png))
+	else:
 		try:
-			driver.execute_cdp_cmd(
-				"Page.addScriptToEvaluateOnNewDocument",
-				{"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"},
-			)
-		except Exception:
+			(_SCREENSHOTS_DIR / name).write_bytes(png)
+		except OSError:
 			pass
-		return driver
-	except SessionNotCreatedException:
-		# Re-raise if we couldn't use webdriver-manager above
-		raise
+
+
+def _dump_error_screenshot(driver) -> None:
+	"""In on-error mode, capture the failure state once, named after the last step."""
+	if _SCREENSHOTS_MODE != "on-error" or driver is None:
+		return
+	last = _PENDING_SHOTS[-1] if _PENDING_SHOTS else "00_start.png"
+	try:
+		_SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+		driver.save_screenshot(str(_SCREENSHOTS_DIR / f"error_{last}"))
+	except (WebDriverException, OSError):
+		pass
+
+
+def _wait(driver, timeout: int) -> WebDriverWait:
+	"""Return a cached WebDriverWait for this driver polling at 100ms.
+
+	The default 500ms poll frequency bounds how quickly an element is
+	discovered once it appears; 100ms picks it up to 5x sooner at negligible
+	CPU cost. Waiters are cached per (driver, timeout) to avoid rebuilding.
+	"""
+	cache = getattr(driver, "_wait_cache", None)
+	if cache is None:
+		cache = {}
+		driver._wait_cache = cache
+	waiter = cache.get(timeout)
+	if waiter is None:
+		waiter = WebDriverWait(driver, timeout, poll_frequency=0.1)
+		cache[timeout] = waiter
+	return waiter
+
+
+def _fast_set_value(driver, el, value: str) -> None:
+	"""Set an input's value in one script call instead of per-character send_keys.
+
+	send_keys costs one WebDriver command per character; this writes through
+	the native HTMLInputElement value setter (a plain .value assignment is
+	deduped by React's value tracker, so the framework never sees it) and
+	dispatches input/change events so framework listeners fire.
+	"""
+	driver.execute_script(
+		"const set = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;"
+		"arguments[0].focus(); set.call(arguments[0], arguments[1]);"
+		"arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+		"arguments[0].dispatchEvent(new Event('change', {bubbles: true}));",
+		el,
+		value,
+	)
+
+
+def _scroll_click(driver, el) -> None:
+	"""Scroll an element into view and click it in a single WebDriver round-trip.
+
+	The in-page click also sidesteps the intermittent click-intercept errors
+	that the separate scroll + native click sequence was prone to.
+	"""
+	driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", el)
+
+
+def _wait_ready(driver, conditions, timeout: int) -> None:
+	"""Block until any of the given expected conditions holds, tolerating timeouts.
+
+	Used in place of fixed sleeps after navigations/clicks so the flow resumes
+	the moment the page signals readiness instead of idling a constant interval.
+	"""
+	try:
+		_wait(driver, timeout).until(EC.any_of(*conditions))
+	except TimeoutException:
+		pass
 
 
 def get_safari_driver() -> webdriver.Safari:
@@ -114,6 +635,166 @@ def get_safari_driver() -> webdriver.Safari:
 	return webdriver.Safari()
 
 
+POOL_SIZE = int(os.getenv("NAUKRI_POOL_SIZE", "2"))
+
+
+class BrowserPool:
+	"""Pool of pre-warmed Chrome drivers reused across runs.
+
+	Launching Chrome costs 2-3s per run; for repeated invocations (scheduled
+	re-runs, parameterized sweeps) keeping drivers alive and handing them out
+	per request removes that cold start entirely. Drivers are recycled after
+	max_uses hand-outs, or immediately when a run leaves them broken.
+	"""
+
+	def __init__(self, size: int = POOL_SIZE, headless: bool = True, max_uses: int = 25):
+		self._headless = headless
+		self._max_uses = max_uses
+		self._drivers: queue.Queue = queue.Queue()
+		for _ in range(max(1, size)):
+			self._drivers.put((get_chrome_driver(headless=headless), 0))
+
+	@contextmanager
+	def acquire(self):
+		"""Borrow a driver; on exit it is reset and returned to the pool."""
+		driver, uses = self._drivers.get()
+		try:
+			yield driver
+		finally:
+			uses += 1
+			try:
+				# Reset per-run state so the next borrower starts clean
+				driver.delete_all_cookies()
+				driver.get("about:blank")
+			except WebDriverException:
+				uses = self._max_uses  # force recycle of a broken driver
+			if uses >= self._max_uses:
+				try:
+					driver.quit()
+				except WebDriverException:
+					pass
+				driver, uses = get_chrome_driver(headless=self._headless), 0
+			self._drivers.put((driver, uses))
+
+	def close(self) -> None:
+		"""Quit every pooled driver."""
+		while True:
+			try:
+				driver, _ = self._drivers.get_nowait()
+			except queue.Empty:
+				return
+			try:
+				driver.quit()
+			except WebDriverException:
+				pass
+
+
+def _run_login_flow(driver, email: str, password: str, timeout: int = 20) -> None:
+	"""Drive the full OTP login + profile-save flow on an already-running driver."""
+	wait = _wait(driver, timeout)
+	in_ci = os.getenv("GITHUB_ACTIONS", "").lower() == "true"
+	# CI starts directly on the login page, skipping the home-page detour
+	start_url = "https://login.naukri.com/nLogin/Login.php" if in_ci else "https://www.naukri.com/"
+	driver.get(start_url)
+
+	# wait for either the home-page login layer or the login form itself;
+	# the observer fires the instant either node lands in the DOM
+	_wait_for_selector_cdp(driver, "#login_Layer, input[type='email'], #usernameField", timeout)
+
+	if not in_ci:
+		# Dismiss common popups/cookie banners in one in-page sweep; the banner
+		# either shows on first paint or not at all, so a single pass is enough
+		_dismiss_popups(driver)
+		_save_screenshot(driver, "01_home.png")
+
+	# If we're not already on the login page, click the Login link
+	if not in_ci and "login" not in driver.current_url.lower():
+		# Wait for the login link to be present (not necessarily clickable due
+		# to overlays); all candidate locators are polled concurrently per tick
+		try:
+			el = _wait(driver, TIMEOUTS.field).until(
+				EC.any_of(*(EC.presence_of_element_located(loc) for loc in LOGIN_LOCATORS))
+			)
+		except TimeoutException:
+			raise TimeoutException("Login element not found")
+
+		# Scroll and JS-click to avoid intermittent intercepts
+		_scroll_click(driver, el)
+
+		# Wait for the resulting login layer/navigation instead of sleeping
+		_wait_ready(
+			driver,
+			(
+				EC.url_contains("login"),
+				EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='email'], #usernameField")),
+			),
+			timeout,
+		)
+
+		# Heuristic: either navigates to a login page or opens a login layer
+		current_url = driver.current_url
+		print(f"After click, URL: {current_url}")
+
+		# Save a proof screenshot
+		_save_screenshot(driver, "02_after_click.png")
+
+	# OTP login flow (default): click "Use OTP to Login", send OTP to email, fetch via IMAP, fill and verify
+	try:
+		imap_host = os.getenv("IMAP_HOST", "imap.gmail.com")
+		imap_user = os.getenv("NAUKRI_EMAIL", email)
+		imap_pass = os.getenv("NAUKRI_PASSWORD", password)
+		otp_sender = os.getenv("OTP_SENDER", "naukri")
+		otp_subject = os.getenv("OTP_SUBJECT", "otp|verification|login")
+
+		# Poll IMAP in a worker thread while the browser drives the OTP
+		# request and waits for the input boxes; the email round-trip and the
+		# DOM wait overlap instead of running back to back
+		otp_timeout = max(60, timeout)
+		otp_stop = threading.Event()
+		with ThreadPoolExecutor(max_workers=1) as executor:
+			otp_future = executor.submit(
+				fetch_otp_via_imap,
+				imap_host, imap_user, imap_pass,
+				timeout=otp_timeout, sender_hint=otp_sender, subject_hint=otp_subject,
+				stop=otp_stop,
+			)
+			try:
+				start_otp_login(driver, email=email, timeout=timeout)
+				print("Requested OTP to email.")
+				_save_screenshot(driver, "03_otp_challenge.png")
+				otp = otp_future.result(timeout=otp_timeout + 10)
+			except Exception:
+				# Unblock the worker before re-raising: the context manager's
+				# shutdown(wait=True) would otherwise stall the failure path
+				# for the full OTP timeout, polling for a code never requested
+				otp_stop.set()
+				raise
+		print(f"Fetched OTP: {'*' * len(otp)}")
+
+		fill_otp(driver, otp, timeout=timeout)
+		print("Entered OTP and submitted.")
+
+		try:
+			navigate_profile_and_save(driver, timeout=timeout)
+			print("Navigated to View profile, clicked edit, and pressed Save.")
+		except TimeoutException:
+			print("Profile/edit/save elements not found within timeout.")
+	except TimeoutException as te:
+		print(f"OTP login flow failed within timeout: {te}")
+
+	# Soft assertion: URL contains 'login' or a visible username/email field appears
+	try:
+		wait.until(
+			EC.any_of(
+				EC.url_contains("login"),
+				EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='email'], input[name*='user'], input[name*='email']")),
+			)
+		)
+		print("Login action appears successful (login page or layer detected).")
+	except TimeoutException:
+		print("Clicked Login, but couldn't confirm login page/layer within timeout. Check screenshots.")
+
+
 def click_naukri_login(
 	headless: bool = True,
 	timeout: int = 20,
@@ -122,18 +803,40 @@ def click_naukri_login(
 	use_google: bool = False,
 	google_email: str = "",
 	google_password: str = "",
+	pool: "BrowserPool | None" = None,
+	page_load_strategy: str = "eager",
+	user_data_dir: str | None = None,
+	attach: str | None = None,
 ) -> None:
 	"""Open naukri.com and click the Login button.
 
 	This tries Chrome first; if unavailable, falls back to Safari on macOS.
-	Saves a screenshot before and after clicking for quick verification.
+	Saves a screenshot before and after clicking when --screenshots is set.
+	When a BrowserPool is supplied, a pre-warmed driver is borrowed and
+	returned instead of launching and quitting Chrome for this one call.
+	When attach is set, the session in the already-running browser is reused
+	and left open afterwards (only the WebDriver connection is closed).
 	"""
+	if pool is not None:
+		with pool.acquire() as driver:
+			try:
+				_run_login_flow(driver, email=email, password=password, timeout=timeout)
+			except Exception:
+				_dump_error_screenshot(driver)
+				raise
+		return
+
 	driver = None
 	tried = []
 	try:
 		try:
-			driver = get_chrome_driver(headless=headless)
-			tried.append("chrome")
+			driver = get_chrome_driver(
+				headless=headless,
+				page_load_strategy=page_load_strategy,
+				user_data_dir=user_data_dir,
+				attach=attach,
+			)
+			tried.append("chrome (attached)" if attach else "chrome")
 		except WebDriverException as e:
 			# Fallback to Safari on macOS if Chrome isn't available
 			tried.append(f"chrome: {e.__class__.__name__}")
@@ -144,155 +847,32 @@ def click_naukri_login(
 				tried.append(f"safari: {e2.__class__.__name__}")
 				raise
 
-		wait = WebDriverWait(driver, timeout)
-		start_url = (
-			"https://login.naukri.com/nLogin/Login.php"
-			if os.getenv("GITHUB_ACTIONS", "").lower() == "true"
-			else "https://www.naukri.com/"
-		)
-		driver.get(start_url)
-
-
-		# small settle
-		time.sleep(1.0)
-		
-		# Attempt to dismiss common popups/cookie banners if they appear
-		def try_click_css(selector: str):
-			try:
-				el = driver.find_element(By.CSS_SELECTOR, selector)
-				driver.execute_script("arguments[0].click();", el)
-				return True
-			except Exception:
-				return False
-
-		def try_click_xpath(xpath: str):
-			try:
-				el = driver.find_element(By.XPATH, xpath)
-				driver.execute_script("arguments[0].click();", el)
-				return True
-			except Exception:
-				return False
-
-		# give overlays a moment to render
-		time.sleep(0.5)
-		for _ in range(2):  # try twice in case of delayed render
-			dismissed = False
-			dismissed |= try_click_css("#onetrust-accept-btn-handler")  # OneTrust cookies
-			dismissed |= try_click_css("button#onetrust-accept-btn-handler")
-			dismissed |= try_click_css("#wzrk-cancel")  # CleverTap push prompt cancel
-			dismissed |= try_click_css("#wzrk-confirm")
-			dismissed |= try_click_xpath("//button[contains(., 'Accept')]")
-			dismissed |= try_click_xpath("//button[contains(., 'Got it') or contains(., 'GOT IT')]")
-			if not dismissed:
-				break
-			time.sleep(0.4)
-
-		Path("screenshots").mkdir(exist_ok=True)
-		driver.save_screenshot("screenshots/01_home.png")
-
-		# If we're not already on the login page, click the Login link
-		if "login" not in driver.current_url.lower():
-			# Wait for the login link to be present (not necessarily clickable due to overlays)
-			login_locators = [
-				(By.ID, "login_Layer"),
-				(By.CSS_SELECTOR, "a#login_Layer"),
-				(By.CSS_SELECTOR, "a[title='Jobseeker Login']"),
-				(By.XPATH, "//a[@id='login_Layer' or @title='Jobseeker Login' or contains(@class,'nI-gNb-lg-rg__login')]")
-			]
-			el = None
-			last_exc = None
-			for loc in login_locators:
-				try:
-					el = WebDriverWait(driver, max(6, timeout // 2)).until(EC.presence_of_element_located(loc))
-					if el:
-						break
-				except TimeoutException as te:
-					last_exc = te
-					continue
-			if not el:
-				raise last_exc or TimeoutException("Login element not found")
-
-			# Scroll and JS-click to avoid intermittent intercepts
-			driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el)
-			try:
-				el.click()
-			except Exception:
-				driver.execute_script("arguments[0].click();", el)
-
-			# Optional: wait briefly for resulting layer/navigation
-			time.sleep(1.5)
-
-			# Heuristic: either navigates to a login page or opens a login layer
-			current_url = driver.current_url
-			print(f"After click, URL: {current_url}")
-
-			# Save a proof screenshot
-			driver.save_screenshot("screenshots/02_after_click.png")
-
-		# OTP login flow (default): click "Use OTP to Login", send OTP to email, fetch via IMAP, fill and verify
-		try:
-			start_otp_login(driver, email=email, timeout=timeout)
-			print("Requested OTP to email.")
-			Path("screenshots").mkdir(exist_ok=True)
-			driver.save_screenshot("screenshots/03_otp_challenge.png")
-
-			# Fetch OTP via IMAP
-			imap_host = os.getenv("IMAP_HOST", "imap.gmail.com")
-			imap_user = os.getenv("NAUKRI_EMAIL", email)
-			imap_pass = os.getenv("NAUKRI_PASSWORD", password)
-			otp_sender = os.getenv("OTP_SENDER", "naukri")
-			otp_subject = os.getenv("OTP_SUBJECT", "otp|verification|login")
-			otp = fetch_otp_via_imap(imap_host, imap_user, imap_pass, timeout=max(60, timeout), sender_hint=otp_sender, subject_hint=otp_subject)
-			print(f"Fetched OTP: {'*' * len(otp)}")
-
-			fill_otp(driver, otp, timeout=timeout)
-			print("Entered OTP and submitted.")
-
-			try:
-				navigate_profile_and_save(driver, timeout=timeout)
-				print("Navigated to View profile, clicked edit, and pressed Save.")
-			except TimeoutException:
-				print("Profile/edit/save elements not found within timeout.")
-		except TimeoutException as te:
-			print(f"OTP login flow failed within timeout: {te}")
-
-		# Soft assertion: URL contains 'login' or a visible username/email field appears
-		try:
-			wait.until(
-				EC.any_of(
-					EC.url_contains("login"),
-					EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='email'], input[name*='user'], input[name*='email']")),
-				)
-			)
-			print("Login action appears successful (login page or layer detected).")
-		except TimeoutException:
-			print("Clicked Login, but couldn't confirm login page/layer within timeout. Check screenshots.")
-
+		_run_login_flow(driver, email=email, password=password, timeout=timeout)
+	except Exception:
+		_dump_error_screenshot(driver)
+		raise
 	finally:
-		if driver is not None:
+		if driver is not None and not attach:
+			# An attached browser outlives us; quitting would close the
+			# user's session and forfeit the warm-run benefit
 			driver.quit()
 		if tried:
 			print(f"Tried drivers: {', '.join(tried)}")
 
 
 def start_otp_login(driver, email: str, timeout: int = 20) -> None:
-	wait = WebDriverWait(driver, timeout)
 	# Click "Use OTP to Login" if present
 	otp_link_locators = [
 		(By.XPATH, "//a[contains(normalize-space(.), 'Use OTP') and contains(normalize-space(.), 'Login')]") ,
 		(By.XPATH, "//button[contains(normalize-space(.), 'Use OTP') and contains(normalize-space(.), 'Login')]") ,
 		(By.CSS_SELECTOR, "a[href*='otp' i], button[href*='otp' i]") ,
 	]
-	for loc in otp_link_locators:
+	el = _first_present(driver, otp_link_locators) or _poll_first(driver, otp_link_locators, TIMEOUTS.submit)
+	if el is not None:
 		try:
-			el = WebDriverWait(driver, max(4, timeout//2)).until(EC.element_to_be_clickable(loc))
-			try:
-				el.click()
-			except Exception:
-				driver.execute_script("arguments[0].click();", el)
-			break
-		except TimeoutException:
-			continue
+			el.click()
+		except Exception:
+			driver.execute_script("arguments[0].click();", el)
 
 	# Enter email/username
 	email_locators = [
@@ -301,14 +881,7 @@ def start_otp_login(driver, email: str, timeout: int = 20) -> None:
 		(By.CSS_SELECTOR, "input[name*='email' i]"),
 		(By.CSS_SELECTOR, "input[placeholder*='Email' i]"),
 	]
-	email_el = None
-	for loc in email_locators:
-		try:
-			email_el = wait.until(EC.visibility_of_element_located(loc))
-			if email_el:
-				break
-		except TimeoutException:
-			continue
+	email_el = _first_present(driver, email_locators) or _poll_first(driver, email_locators, timeout)
 	if not email_el:
 		raise TimeoutException("Email field not found for OTP login")
 	try:
@@ -323,116 +896,286 @@ def start_otp_login(driver, email: str, timeout: int = 20) -> None:
 		(By.CSS_SELECTOR, "button[type='submit']"),
 		(By.XPATH, "//input[@type='submit']"),
 	]
-	clicked = False
-	for loc in send_locators:
+	btn = _first_present(driver, send_locators) or _poll_first(driver, send_locators, TIMEOUTS.submit)
+	if btn is not None:
 		try:
-			btn = wait.until(EC.element_to_be_clickable(loc))
-			try:
-				btn.click()
-			except Exception:
-				driver.execute_script("arguments[0].click();", btn)
-			clicked = True
-			break
-		except TimeoutException:
-			continue
-	if not clicked:
+			btn.click()
+		except Exception:
+			driver.execute_script("arguments[0].click();", btn)
+	else:
 		# fallback: press Enter in email field
 		email_el.send_keys(Keys.ENTER)
 
-	# Wait for OTP input UI to appear
-	WebDriverWait(driver, max(10, timeout)).until(
-		EC.any_of(
-			EC.presence_of_all_elements_located((By.CSS_SELECTOR, "input[type='tel'][maxlength='1'], input[aria-label*='OTP' i]")),
-			EC.presence_of_element_located((By.XPATH, "//input[contains(@name,'otp' i) or contains(@id,'otp' i)]")),
-		)
-	)
-	time.sleep(0.5)
+	# Wait for OTP input UI to appear (presence only; fill_otp re-resolves)
+	if not _wait_for_selector_cdp(
+		driver,
+		"input[type='tel'][maxlength='1'], input[aria-label*='OTP' i], input[name*='otp' i], input[id*='otp' i]",
+		max(10, timeout),
+	):
+		raise TimeoutException("OTP input UI did not appear")
+
+
+# Fetch only the headers we filter on (plus the MIME headers needed to decode
+# the body) and the text body; PEEK avoids marking messages read, HEADER.FIELDS
+# strips unused headers, BODY[TEXT] skips attachments. Far cheaper than
+# dragging the full RFC822 payload per message.
+_OTP_FETCH_PARTS = (
+	'(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE CONTENT-TYPE CONTENT-TRANSFER-ENCODING)]'
+	' BODY.PEEK[TEXT])'
+)
+
+
+def _search_otp_uids(M, sender_hint: str | None):
+	"""UID-search recent OTP candidates, narrowing server-side where possible.
+
+	Scopes to unseen mail from the last 10 minutes (and the sender hint when
+	given) so the server does the filtering; falls back to progressively wider
+	criteria when nothing matches.
+	"""
+	since = (datetime.utcnow() - timedelta(minutes=10)).strftime('%d-%b-%Y')
+	criteria = ['UNSEEN', 'SINCE', since]
+	if sender_hint:
+		criteria += ['FROM', sender_hint]
+	typ, data = M.uid('SEARCH', None, *criteria)
+	uids = data[0].split() if typ == 'OK' else []
+	if not uids:
+		typ, data = M.uid('SEARCH', None, 'SINCE', since)
+		uids = data[0].split() if typ == 'OK' else []
+	if not uids:
+		typ, data = M.uid('SEARCH', None, 'ALL')
+		uids = data[0].split()[-10:] if typ == 'OK' else []  # recent 10
+	return uids
+
+
+def _imap_idle_wait(M, timeout: float) -> bool:
+	"""Wait on IMAP IDLE until the server pushes activity or timeout elapses.
+
+	Hand-rolls RFC 2177 IDLE on the existing imaplib connection (stdlib has no
+	native support): send IDLE, select() on the socket, send DONE. Returns
+	True when IDLE handled the wait; False when the server lacks or refuses
+	IDLE, in which case the caller falls back to fixed-interval sleeping.
+	Raises imaplib.IMAP4.abort if the server closes the connection mid-IDLE,
+	so the caller can discard it and reconnect.
+	"""
+	if 'IDLE' not in M.capabilities:
+		return False
+	tag = M._new_tag()
+	try:
+		M.send(b'%s IDLE\r\n' % tag)
+		# Find the continuation; skip untagged responses left over from
+		# earlier commands (e.g. '* N EXISTS' trailing the last FETCH) so a
+		# stale line isn't mistaken for a refusal while IDLE is live
+		while True:
+			line = M.readline()
+			if not line:
+				raise imaplib.IMAP4.abort('connection closed while entering IDLE')
+			if line.startswith(b'*'):
+				continue
+			if line.startswith(b'+'):
+				break
+			return False  # tagged NO/BAD: server refused
+		sock = M.socket()
+		ready, _, _ = select.select([sock], [], [], timeout)
+		if ready:
+			M.readline()  # consume the untagged EXISTS/RECENT push
+		M.send(b'DONE\r\n')
+		# drain until the tagged completion of IDLE; an empty line means the
+		# server hung up, which must not spin here nor pass as success
+		while True:
+			line = M.readline()
+			if not line:
+				raise imaplib.IMAP4.abort('connection closed during IDLE')
+			if line.startswith(tag):
+				break
+		return True
+	except imaplib.IMAP4.abort:
+		raise
+	except (OSError, imaplib.IMAP4.error):
+		return False
+
+
+# Compiled once at module scope; prefer an exact 6-digit code (the common
+# OTP shape) and only fall back to 4-8 digits when none is present
+_OTP6_RE = re.compile(r"\b(\d{6})\b")
+_OTP_RE = re.compile(r"\b(\d{4,8})\b")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
 
+def _extract_otp(text: str) -> str | None:
+	"""Pull the most likely OTP code out of a message body, or None."""
+	m = _OTP6_RE.search(text)
+	if m:
+		return m.group(1)
+	codes = _OTP_RE.findall(text)
+	codes_sorted = sorted(codes, key=lambda c: (abs(len(c) - 6), -len(c)))
+	return codes_sorted[0] if codes_sorted else None
 
-def fetch_otp_via_imap(host: str, user: str, password: str, timeout: int = 90, poll_interval: int = 5, sender_hint: str | None = None, subject_hint: str | None = None) -> str:
+
+# Bounded batch keeps the single FETCH below server request-size limits
+_OTP_FETCH_BATCH = 10
+
+# Headers-only parser: the FETCH already limits the first chunk to a handful
+# of header fields, so skip the MIME body machinery entirely when reading them
+_HEADER_PARSER = BytesHeaderParser()
+
+
+def _decode_text_parts(msg) -> str:
+	"""Decode every text part of a parsed message into one string.
+
+	Honors the Content-Transfer-Encoding (base64/quoted-printable) via
+	get_payload(decode=True) — raw transfer-encoded bytes would hide the code
+	or, worse, let digit runs inside base64 pass for one.
+	"""
+	parts = []
+	stack = [msg]
+	while stack:
+		m = stack.pop()
+		if m.is_multipart():
+			stack.extend(reversed(m.get_payload()))
+			continue
+		if m.get_content_maintype() != 'text':
+			continue
+		payload = m.get_payload(decode=True) or b''
+		charset = m.get_content_charset() or 'utf-8'
+		try:
+			parts.append(payload.decode(charset, errors='ignore'))
+		except LookupError:
+			parts.append(payload.decode('utf-8', errors='ignore'))
+	return "\n".join(parts)
+
+
+def _scan_otp_batch(M, uids, sender_hint: str | None, subject_hint: str | None) -> str | None:
+	"""Fetch up to _OTP_FETCH_BATCH candidates in one command and scan newest-first.
+
+	One ranged FETCH replaces a round-trip per message; the scan short-circuits
+	on the first message yielding a code.
+	"""
+	if not uids:
+		return None
+	msg_set = b",".join(uids[-_OTP_FETCH_BATCH:]).decode()
+	typ, msg_data = M.uid('FETCH', msg_set, _OTP_FETCH_PARTS)
+	if typ != 'OK' or not msg_data:
+		return None
+	# imaplib yields one (prefix, payload) tuple per body section, with a
+	# bare b')' terminating each message; group the sections per message
+	messages = []
+	current = []
+	for part in msg_data:
+		if isinstance(part, tuple) and len(part) > 1:
+			current.append(part[1])
+		elif current:
+			messages.append(current)
+			current = []
+	if current:
+		messages.append(current)
+
+	# Hints are parsed once, not per message
+	sender_needle = sender_hint.lower() if sender_hint else None
+	subject_needles = tuple(subject_hint.lower().split('|')) if subject_hint else ()
+
+	for chunks in reversed(messages):  # newest first
+		headers = _HEADER_PARSER.parsebytes(chunks[0])
+		from_addr = headers.get('From', '')
+		subject = headers.get('Subject', '')
+		if sender_needle and sender_needle not in from_addr.lower():
+			# if hint provided, filter by it
+			if not (subject_needles and any(h in subject.lower() for h in subject_needles)):
+				continue
+		# Reassemble headers + body so the MIME transfer encoding and charset
+		# are applied; the Content-Type header carries the multipart boundary
+		raw = chunks[0].rstrip(b"\r\n") + b"\r\n\r\n" + b"\r\n".join(chunks[1:])
+		body_text = _decode_text_parts(message_from_bytes(raw))
+		if '<' in body_text:
+			# strip markup so digits inside attributes/entities don't win
+			body_text = _HTML_TAG_RE.sub(' ', body_text)
+		code = _extract_otp(body_text)
+		if code:
+			return code
+	return None
+
+
+def fetch_otp_via_imap(host: str, user: str, password: str, timeout: int = 90, poll_interval: int = 5, sender_hint: str | None = None, subject_hint: str | None = None, stop: "threading.Event | None" = None) -> str:
 	"""Poll IMAP for the latest OTP email and extract a numeric code.
 
-	Returns the first 6-8 digit code found, preferring 6.
+	Returns the first 6-8 digit code found, preferring 6. When a stop event
+	is supplied, setting it aborts the poll loop early (used to cancel the
+	background fetch when the browser side of the flow fails).
 	"""
 	end_time = time.time() + max(15, timeout)
 	last_error = None
-	while time.time() < end_time:
-		try:
-			with imaplib.IMAP4_SSL(host) as M:
-				M.login(user, password)
-				M.select('INBOX')
-				# Look for UNSEEN first; fallback to recent ALL
-				typ, data = M.search(None, 'UNSEEN')
-				ids = data[0].split() if typ == 'OK' else []
-				if not ids:
-					typ, data = M.search(None, 'ALL')
-					ids = data[0].split()[-10:] if typ == 'OK' else []  # recent 10
-				for msg_id in reversed(ids):  # newest first
-					typ, msg_data = M.fetch(msg_id, '(RFC822)')
-					if typ != 'OK' or not msg_data:
-						continue
-					msg = py_email.message_from_bytes(msg_data[0][1])
-					from_addr = msg.get('From', '')
-					subject = msg.get('Subject', '')
-					if sender_hint and sender_hint.lower() not in from_addr.lower():
-						# if hint provided, filter by it
-						if not (subject_hint and any(h in subject.lower() for h in subject_hint.split('|'))):
-							continue
-					# extract text
-					body_text = ""
-					if msg.is_multipart():
-						for part in msg.walk():
-							ctype = part.get_content_type()
-							if ctype in ('text/plain', 'text/html'):
-								try:
-									body_text += part.get_payload(decode=True).decode(part.get_content_charset() or 'utf-8', errors='ignore') + "\n"
-								except Exception:
-									continue
-					else:
-						try:
-							body_text = msg.get_payload(decode=True).decode(msg.get_content_charset() or 'utf-8', errors='ignore')
-						except Exception:
-							body_text = msg.get_payload() or ''
-					# Find OTP numbers
-					codes = re.findall(r"\b(\d{4,8})\b", body_text)
-					# Prefer 6-digit
-					codes_sorted = sorted(codes, key=lambda c: (abs(len(c) - 6), -len(c)))
-					if codes_sorted:
-						return codes_sorted[0]
-		except Exception as e:
-			last_error = e
-		time.sleep(poll_interval)
-	raise TimeoutException(f"Could not retrieve OTP via IMAP within {timeout}s. Last error: {last_error}")
+	# One connection for the whole poll loop: TLS handshake + LOGIN + SELECT
+	# cost a second or more each, which used to be paid on every iteration
+	M = None
+	try:
+		while time.time() < end_time:
+			if stop is not None and stop.is_set():
+				raise TimeoutException("OTP fetch cancelled before a code arrived")
+			idled = False
+			try:
+				if M is None:
+					M = imaplib.IMAP4_SSL(host)
+					M.login(user, password)
+					M.select('INBOX')
+				code = _scan_otp_batch(M, _search_otp_uids(M, sender_hint), sender_hint, subject_hint)
+				if code:
+					return code
+				# Block on server push rather than a fixed-interval sleep, so
+				# the next scan runs the moment the mail lands
+				idled = _imap_idle_wait(M, poll_interval)
+			except (imaplib.IMAP4.abort, OSError) as e:
+				# Dropped/reset connection: discard and reconnect next pass
+				last_error = e
+				if M is not None:
+					try:
+						M.shutdown()
+					except Exception:
+						pass
+					M = None
+			except Exception as e:
+				last_error = e
+			if not idled:
+				# An Event-based sleep wakes immediately on cancellation
+				if stop is not None:
+					stop.wait(poll_interval)
+				else:
+					time.sleep(poll_interval)
+		raise TimeoutException(f"Could not retrieve OTP via IMAP within {timeout}s. Last error: {last_error}")
+	finally:
+		if M is not None:
+			try:
+				M.logout()
+			except Exception:
+				pass
+
+
+# Fills every OTP digit box in one in-page pass. Uses the native value setter
+# so React-style controlled inputs see the change, then fires input/change on
+# each box — one round-trip instead of clear+send_keys per digit.
+_FILL_OTP_JS = (
+	"const inputs = arguments[0], digits = arguments[1];"
+	"const setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;"
+	"for (let i = 0; i < digits.length; i++) {"
+	" setter.call(inputs[i], digits[i]);"
+	" inputs[i].dispatchEvent(new Event('input', {bubbles: true}));"
+	" inputs[i].dispatchEvent(new Event('change', {bubbles: true}));"
+	"}"
+)
 
 
 def fill_otp(driver, code: str, timeout: int = 20) -> None:
-	wait = WebDriverWait(driver, timeout)
 	digits = list(code.strip())
 	# Try multi-input OTP fields first
 	inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='tel'][maxlength='1'], input[aria-label*='OTP' i]")
 	if inputs and len(inputs) >= len(digits):
-		for i, d in enumerate(digits):
-			try:
-				inputs[i].clear()
-			except Exception:
-				pass
-			inputs[i].send_keys(d)
-		Path("screenshots").mkdir(exist_ok=True)
-		driver.save_screenshot("screenshots/04_otp_filled.png")
+		driver.execute_script(_FILL_OTP_JS, inputs, digits)
+		_save_screenshot(driver, "04_otp_filled.png")
 	else:
 		# Single field fallback
 		single_locators = [
 			(By.XPATH, "//input[contains(@name,'otp' i) or contains(@id,'otp' i)]"),
 			(By.CSS_SELECTOR, "input[name*='otp' i], input[id*='otp' i]")
 		]
-		field = None
-		for loc in single_locators:
-			try:
-				field = wait.until(EC.visibility_of_element_located(loc))
-				if field:
-					break
-			except TimeoutException:
-				continue
+		field = _first_present(driver, single_locators) or _poll_first(driver, single_locators, timeout)
 		if not field:
 			raise TimeoutException("OTP input field not found")
 		try:
@@ -440,7 +1183,7 @@ def fill_otp(driver, code: str, timeout: int = 20) -> None:
 		except Exception:
 			pass
 		field.send_keys(code)
-		driver.save_screenshot("screenshots/04_otp_filled.png")
+		_save_screenshot(driver, "04_otp_filled.png")
 
 	# Click Verify/Submit
 	verify_locators = [
@@ -448,21 +1191,25 @@ def fill_otp(driver, code: str, timeout: int = 20) -> None:
 		(By.CSS_SELECTOR, "button[type='submit']"),
 		(By.XPATH, "//input[@type='submit']"),
 	]
-	for loc in verify_locators:
+	btn = _first_present(driver, verify_locators) or _poll_first(driver, verify_locators, TIMEOUTS.submit)
+	if btn is not None:
 		try:
-			btn = WebDriverWait(driver, max(4, timeout//2)).until(EC.element_to_be_clickable(loc))
-			try:
-				btn.click()
-			except Exception:
-				driver.execute_script("arguments[0].click();", btn)
-			break
-		except TimeoutException:
-			continue
-	time.sleep(1.0)
+			btn.click()
+		except Exception:
+			driver.execute_script("arguments[0].click();", btn)
+	# Verification either navigates onward or tears down the OTP inputs
+	_wait_ready(
+		driver,
+		(
+			EC.url_contains("profile"),
+			EC.url_contains("mnjuser"),
+			EC.invisibility_of_element_located((By.CSS_SELECTOR, "input[type='tel'][maxlength='1']")),
+		),
+		timeout,
+	)
 
 
 def google_sign_in(driver, g_email: str, g_password: str, timeout: int = 30) -> None:
-	wait = WebDriverWait(driver, timeout)
 	# Ensure the login layer is visible; if not on login page, open it using existing flow above.
 	# Click the "Sign in with Google" button
 	google_btn_locators = [
@@ -476,25 +1223,21 @@ def google_sign_in(driver, g_email: str, g_password: str, timeout: int = 30) ->
 		(By.CSS_SELECTOR, "div.social-media .google"),
 		(By.CSS_SELECTOR, "div.google"),
 	]
-	btn = None
-	for loc in google_btn_locators:
-		try:
-			btn = wait.until(EC.element_to_be_clickable(loc))
-			if btn:
-				break
-		except TimeoutException:
-			continue
+	btn = _first_present(driver, google_btn_locators) or _poll_first(driver, google_btn_locators, timeout)
 	if not btn:
 		raise TimeoutException("Google Sign-In button not found")
 
 	before = driver.window_handles
-	driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn)
-	try:
-		btn.click()
-	except Exception:
-		driver.execute_script("arguments[0].click();", btn)
+	_scroll_click(driver, btn)
 
-	time.sleep(1.0)
+	# Wait for the accounts window/redirect instead of sleeping
+	try:
+		_wait(driver, TIMEOUTS.field).until(
+			lambda d: len(d.window_handles) > len(before)
+			or _find_first(d, [(By.ID, "identifierId"), (By.NAME, "identifier")])
+		)
+	except TimeoutException:
+		pass
 	# Switch to Google Accounts window/tab if a new one opened
 	after = driver.window_handles
 	target_handle = None
@@ -508,16 +1251,13 @@ def google_sign_in(driver, g_email: str, g_password: str, timeout: int = 30) ->
 
 	# Now perform Google auth
 	# Sometimes there's an account chooser; click "Use another account" if present
-	try:
-		use_another = WebDriverWait(driver, 5).until(
-			EC.presence_of_element_located((By.XPATH, "//div[@role='button' and .//div[text()='Use another account']]"))
-		)
+	chooser_locators = [(By.XPATH, "//div[@role='button' and .//div[text()='Use another account']]")]
+	use_another = _first_present(driver, chooser_locators) or _poll_first(driver, chooser_locators, TIMEOUTS.popup)
+	if use_another is not None:
 		try:
 			use_another.click()
 		except Exception:
 			driver.execute_script("arguments[0].click();", use_another)
-	except TimeoutException:
-		pass
 
 	# Email step
 	email_locators = [
@@ -526,97 +1266,67 @@ def google_sign_in(driver, g_email: str, g_password: str, timeout: int = 30) ->
 		(By.CSS_SELECTOR, "input[type='email'][id='identifierId']"),
 		(By.CSS_SELECTOR, "input[type='email'][name='identifier']"),
 	]
-	email_input = None
-	last_exc = None
-	for loc in email_locators:
-		try:
-			email_input = wait.until(EC.visibility_of_element_located(loc))
-			if email_input:
-				break
-		except TimeoutException as te:
-			last_exc = te
-			continue
+	email_input = _first_present(driver, email_locators) or _poll_first(driver, email_locators, timeout)
 	if not email_input:
-		raise last_exc or TimeoutException("Google email input not found")
+		raise TimeoutException("Google email input not found")
 
 	try:
 		email_input.clear()
 	except Exception:
 		pass
 	email_input.send_keys(g_email)
-	Path("screenshots").mkdir(exist_ok=True)
-	driver.save_screenshot("screenshots/03a_google_email_filled.png")
+	_save_screenshot(driver, "03a_google_email_filled.png")
 
 	email_next_locators = [
 		(By.ID, "identifierNext"),
 		(By.XPATH, "//span[normalize-space()='Next']/ancestor::*[self::button or self::div][@role='button'][1]"),
 		(By.XPATH, "//*[@id='identifierNext' or @jsname='LgbsSe'][.//span[normalize-space()='Next']]")
 	]
-	clicked_next = False
-	for loc in email_next_locators:
+	next_btn = _first_present(driver, email_next_locators) or _poll_first(driver, email_next_locators, TIMEOUTS.submit)
+	if next_btn is not None:
 		try:
-			next_btn = WebDriverWait(driver, 8).until(EC.element_to_be_clickable(loc))
-			try:
-				next_btn.click()
-			except Exception:
-				driver.execute_script("arguments[0].click();", next_btn)
-			clicked_next = True
-			break
-		except TimeoutException:
-			continue
-	if not clicked_next:
+			next_btn.click()
+		except Exception:
+			driver.execute_script("arguments[0].click();", next_btn)
+	else:
 		# Fallback: press Enter
 		email_input.send_keys(Keys.ENTER)
 
-	time.sleep(0.8)
-	driver.save_screenshot("screenshots/03b_google_after_email_next.png")
+	# The password step rendering is the signal that Next went through
+	_wait_ready(driver, (EC.presence_of_element_located((By.NAME, "Passwd")),), TIMEOUTS.field)
+	_save_screenshot(driver, "03b_google_after_email_next.png")
 
 	# Password step
 	pwd_locators = [
 		(By.NAME, "Passwd"),
 		(By.CSS_SELECTOR, "input[type='password'][name='Passwd']"),
 	]
-	pwd_input = None
-	last_exc = None
-	for loc in pwd_locators:
-		try:
-			pwd_input = wait.until(EC.visibility_of_element_located(loc))
-			if pwd_input:
-				break
-		except TimeoutException as te:
-			last_exc = te
-			continue
+	pwd_input = _first_present(driver, pwd_locators) or _poll_first(driver, pwd_locators, timeout)
 	if not pwd_input:
-		raise last_exc or TimeoutException("Google password input not found")
+		raise TimeoutException("Google password input not found")
 
 	try:
 		pwd_input.clear()
 	except Exception:
 		pass
 	pwd_input.send_keys(g_password)
-	driver.save_screenshot("screenshots/03c_google_password_filled.png")
+	_save_screenshot(driver, "03c_google_password_filled.png")
 
 	pwd_next_locators = [
 		(By.ID, "passwordNext"),
 		(By.XPATH, "//span[normalize-space()='Next']/ancestor::*[self::button or self::div][@role='button'][1]"),
 	]
-	clicked_pwd_next = False
-	for loc in pwd_next_locators:
+	pwd_next = _first_present(driver, pwd_next_locators) or _poll_first(driver, pwd_next_locators, TIMEOUTS.submit)
+	if pwd_next is not None:
 		try:
-			pwd_next = WebDriverWait(driver, 8).until(EC.element_to_be_clickable(loc))
-			try:
-				pwd_next.click()
-			except Exception:
-				driver.execute_script("arguments[0].click();", pwd_next)
-			clicked_pwd_next = True
-			break
-		except TimeoutException:
-			continue
-	if not clicked_pwd_next:
+			pwd_next.click()
+		except Exception:
+			driver.execute_script("arguments[0].click();", pwd_next)
+	else:
 		pwd_input.send_keys(Keys.ENTER)
 
 	# Wait for redirect back to Naukri
-	WebDriverWait(driver, max(10, timeout)).until(
+	_wait(driver, max(10, timeout)).until(
 		EC.any_of(
 			EC.url_contains("naukri.com"),
 			EC.url_matches(r"https?://.*naukri\.com/.*"),
@@ -630,27 +1340,55 @@ def google_sign_in(driver, g_email: str, g_password: str, timeout: int = 30) ->
 				break
 		except Exception:
 			continue
-	Path("screenshots").mkdir(exist_ok=True)
-	driver.save_screenshot("screenshots/03_google_after_login.png")
+	_save_screenshot(driver, "03_google_after_login.png")
+
+
+# Probes the top document and every same-origin iframe in one script call.
+# Returns -1 when the top frame matches, the iframe index otherwise, or -2
+# when nothing matched (cross-origin frames are opaque to this probe).
+_FRAME_PROBE_JS = (
+	"const sel = arguments[0];"
+	"if (document.querySelector(sel)) return -1;"
+	"const frames = document.querySelectorAll('iframe');"
+	"for (let i = 0; i < frames.length; i++) {"
+	" try {"
+	"  const d = frames[i].contentDocument;"
+	"  if (d && d.querySelector(sel)) return i;"
+	" } catch (e) {}"
+	"}"
+	"return -2;"
+)
 
 
 def _switch_to_frame_with_inputs(driver, email_locators, password_locators, timeout=5):
-	# Try default content first
+	# One in-page probe covers the top document and all same-origin iframes,
+	# replacing a switch_to.frame round-trip per iframe (naukri.com embeds
+	# several tracking iframes)
+	try:
+		idx = driver.execute_script(_FRAME_PROBE_JS, "input[type='email'], input[type='password']")
+		if idx == -1:
+			return True  # already in the right context
+		if idx >= 0:
+			driver.switch_to.frame(idx)
+			return True
+	except WebDriverException:
+		pass
+
+	# Full locator probe in the default content before touching any frames
 	try:
-		for loc in email_locators + password_locators:
-			if driver.find_elements(*loc):
-				return True  # already in the right context
+		if _find_first(driver, email_locators + password_locators):
+			return True
 	except Exception:
 		pass
 
-	# Try each iframe
+	# Last resort: walk frames one by one — only cross-origin iframes (which
+	# the JS probe cannot see into) can still hide the inputs at this point
 	iframes = driver.find_elements(By.TAG_NAME, "iframe")
 	for idx, frame in enumerate(iframes):
 		try:
 			driver.switch_to.frame(frame)
-			for loc in email_locators + password_locators:
-				if driver.find_elements(*loc):
-					return True
+			if _find_first(driver, email_locators + password_locators):
+				return True
 			driver.switch_to.default_content()
 		except Exception:
 			try:
@@ -662,105 +1400,76 @@ def _switch_to_frame_with_inputs(driver, email_locators, password_locators, time
 
 
 def fill_credentials(driver, email: str, password: str, timeout: int = 20) -> None:
-	wait_short = WebDriverWait(driver, max(5, timeout // 2))
-
-	email_locators = [
-		(By.CSS_SELECTOR, "input[type='email']"),
-		(By.CSS_SELECTOR, "input[id*='email' i]"),
-		(By.CSS_SELECTOR, "input[name*='email' i]"),
-		(By.CSS_SELECTOR, "input[placeholder*='Email' i]"),
-		(By.CSS_SELECTOR, "input[placeholder*='Username' i]"),
-		(By.ID, "usernameField"),
-	]
-	password_locators = [
-		(By.CSS_SELECTOR, "input[type='password']"),
-		(By.CSS_SELECTOR, "input[id*='pass' i]"),
-		(By.CSS_SELECTOR, "input[name*='pass' i]"),
-		(By.CSS_SELECTOR, "input[placeholder*='password' i]"),
-		(By.ID, "passwordField"),
-	]
-
 	# Try to ensure correct context
-	_switch_to_frame_with_inputs(driver, email_locators, password_locators, timeout=max(5, timeout // 2))
+	_switch_to_frame_with_inputs(driver, EMAIL_LOCATORS, PASSWORD_LOCATORS, timeout=TIMEOUTS.field)
 
-	# Find elements
-	email_el = None
-	for loc in email_locators:
-		try:
-			email_el = wait_short.until(EC.presence_of_element_located(loc))
-			if email_el:
-				break
-		except TimeoutException:
-			continue
+	# Find elements: one batched in-page probe per poll instead of per-locator waits
+	email_el = _poll_first(driver, EMAIL_LOCATORS, TIMEOUTS.field)
 	if not email_el:
 		raise TimeoutException("Email/username field not found")
 
-	pwd_el = None
-	for loc in password_locators:
-		try:
-			pwd_el = wait_short.until(EC.presence_of_element_located(loc))
-			if pwd_el:
-				break
-		except TimeoutException:
-			continue
+	pwd_el = _poll_first(driver, PASSWORD_LOCATORS, TIMEOUTS.field)
 	if not pwd_el:
 		raise TimeoutException("Password field not found")
 
-	# Fill values
-	driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", email_el)
-	try:
-		email_el.clear()
-	except Exception:
-		pass
-	email_el.send_keys(email)
-
-	driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", pwd_el)
-	try:
-		pwd_el.clear()
-	except Exception:
-		pass
-	pwd_el.send_keys(password)
+	# Fill values in one script call per field instead of clear + per-char keys
+	_fast_set_value(driver, email_el, email)
+	_fast_set_value(driver, pwd_el, password)
 
 	# Proof screenshot
-	Path("screenshots").mkdir(exist_ok=True)
-	driver.save_screenshot("screenshots/03_filled_fields.png")
+	_save_screenshot(driver, "03_filled_fields.png")
 
 
 def click_login_submit(driver, timeout: int = 20) -> None:
-	wait_short = WebDriverWait(driver, max(5, timeout // 2))
-
-	submit_locators = [
-		(By.CSS_SELECTOR, "button.btn-primary.loginButton"),
-		(By.CSS_SELECTOR, "button.loginButton"),
-		(By.XPATH, "//button[@type='submit' and contains(@class,'loginButton')]")
-		,
-		(By.XPATH, "//button[contains(., 'Login') or contains(., 'Log In')]")
-		,
-		(By.CSS_SELECTOR, "input[type='submit']"),
-	]
-
-	el = None
-	last_exc = None
-	for loc in submit_locators:
-		try:
-			el = wait_short.until(EC.presence_of_element_located(loc))
-			if el:
-				break
-		except TimeoutException as te:
-			last_exc = te
-			continue
+	el = _poll_first(driver, SUBMIT_LOCATORS, TIMEOUTS.submit)
 	if not el:
-		raise last_exc or TimeoutException("Login submit button not found")
+		raise TimeoutException("Login submit button not found")
+
+	_scroll_click(driver, el)
+
+	# Either we land on the logged-in dashboard or on the nlogin error page
+	_wait_ready(driver, (EC.url_contains("mnjuser"), EC.url_contains("nlogin")), timeout)
+	_save_screenshot(driver, "04_after_submit.png")
+
+
+# Whole credential-login state machine shipped to the browser in one payload:
+# find both inputs, set values, fire framework events, click submit. Returns
+# 'ok' on success or 'missing' so the caller can fall back to element-wise.
+_JS_LOGIN = (
+	"const e = document.querySelector(arguments[2]);"
+	"const p = document.querySelector(arguments[3]);"
+	"if (!e || !p) return 'missing';"
+	"const set = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;"
+	"for (const [el, v] of [[e, arguments[0]], [p, arguments[1]]]) {"
+	" el.focus(); set.call(el, v);"
+	" el.dispatchEvent(new Event('input', {bubbles: true}));"
+	" el.dispatchEvent(new Event('change', {bubbles: true}));"
+	"}"
+	"const btn = document.querySelector(\"button.loginButton, button[type='submit'], input[type='submit']\");"
+	"if (!btn) return 'missing';"
+	"btn.click();"
+	"return 'ok';"
+)
 
-	driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el)
-	try:
-		el.click()
-	except Exception:
-		driver.execute_script("arguments[0].click();", el)
 
-	time.sleep(1.5)
-	Path("screenshots").mkdir(exist_ok=True)
-	driver.save_screenshot("screenshots/04_after_submit.png")
+def fill_and_submit_login(driver, email: str, password: str, timeout: int = 20) -> None:
+	"""Fill the login form and submit it in a single in-page script call.
+
+	Falls back to the element-by-element fill_credentials + click_login_submit
+	path when the one-shot payload cannot find the form (e.g. inputs inside an
+	iframe).
+	"""
+	try:
+		status = driver.execute_script(_JS_LOGIN, email, password, EMAIL_CSS, PASSWORD_CSS)
+	except WebDriverException:
+		status = "error"
+	if status != "ok":
+		fill_credentials(driver, email, password, timeout=timeout)
+		click_login_submit(driver, timeout=timeout)
+		return
+	# Either we land on the logged-in dashboard or on the nlogin error page
+	_wait_ready(driver, (EC.url_contains("mnjuser"), EC.url_contains("nlogin")), timeout)
+	_save_screenshot(driver, "04_after_submit.png")
 
 
 def _switch_to_last_window_if_new(driver, before_handles):
@@ -774,104 +1483,85 @@ def _switch_to_last_window_if_new(driver, before_handles):
 
 
 def navigate_profile_and_save(driver, timeout: int = 20) -> None:
-	wait = WebDriverWait(driver, timeout)
-
 	# Try clicking 'View profile'
-	profile_locators = [
-		(By.XPATH, "//a[normalize-space()='View profile']"),
-		(By.CSS_SELECTOR, "a[href='/mnjuser/profile']"),
-		(By.XPATH, "//a[contains(@href, '/mnjuser/profile')]")
-	]
 	before = driver.window_handles
 	clicked = False
-	for loc in profile_locators:
-		try:
-			el = wait.until(EC.presence_of_element_located(loc))
-			driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el)
-			try:
-				el.click()
-			except Exception:
-				driver.execute_script("arguments[0].click();", el)
-			clicked = True
-			break
-		except TimeoutException:
-			continue
+	el = _poll_first(driver, PROFILE_LOCATORS, TIMEOUTS.profile)
+	if el:
+		_scroll_click(driver, el)
+		clicked = True
 
 	if clicked:
 		_switch_to_last_window_if_new(driver, before)
-		# small wait for navigation
-		time.sleep(1.0)
 	else:
 		# Fallback: navigate directly
 		driver.get("https://www.naukri.com/mnjuser/profile")
-		time.sleep(1.0)
+	_wait_ready(
+		driver,
+		(
+			EC.url_contains("mnjuser/profile"),
+			EC.presence_of_element_located((By.CSS_SELECTOR, "em.icon.edit")),
+		),
+		timeout,
+	)
 
-	Path("screenshots").mkdir(exist_ok=True)
-	driver.save_screenshot("screenshots/05_profile_page.png")
+	_save_screenshot(driver, "05_profile_page.png")
 
 	# Click the edit icon (editOneTheme)
-	edit_locators = [
-		(By.XPATH, "//em[contains(@class,'icon') and contains(@class,'edit') and contains(normalize-space(.), 'editOneTheme')]") ,
-		(By.CSS_SELECTOR, "em.icon.edit"),
-	]
-	el_edit = None
-	for loc in edit_locators:
-		try:
-			el_edit = wait.until(EC.presence_of_element_located(loc))
-			if el_edit:
-				break
-		except TimeoutException:
-			continue
+	el_edit = _poll_first(driver, EDIT_LOCATORS, TIMEOUTS.profile)
 	if not el_edit:
 		raise TimeoutException("Edit icon not found")
 
-	driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_edit)
-	try:
-		el_edit.click()
-	except Exception:
-		driver.execute_script("arguments[0].click();", el_edit)
+	_scroll_click(driver, el_edit)
 
-	time.sleep(0.8)
-	driver.save_screenshot("screenshots/06_edit_clicked.png")
+	# Edit form renders the Save button; wait for it rather than sleeping
+	_wait_for_selector_cdp(driver, "#saveBasicDetailsBtn", timeout)
+	_save_screenshot(driver, "06_edit_clicked.png")
 
 	# Click Save button
-	save_locators = [
-		(By.ID, "saveBasicDetailsBtn"),
-		(By.CSS_SELECTOR, "#saveBasicDetailsBtn"),
-		(By.CSS_SELECTOR, "button#saveBasicDetailsBtn.btn-dark-ot"),
-		(By.XPATH, "//button[@id='saveBasicDetailsBtn' or (contains(@class,'btn-dark-ot') and (normalize-space(.)='Save' or contains(@aria-label,'Save')))]"),
-	]
-	el_save = None
-	for loc in save_locators:
-		try:
-			el_save = wait.until(EC.presence_of_element_located(loc))
-			if el_save:
-				break
-		except TimeoutException:
-			continue
+	el_save = _poll_first(driver, SAVE_LOCATORS, TIMEOUTS.profile)
 	if not el_save:
 		raise TimeoutException("Save button not found")
 
-	driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el_save)
-	try:
-		el_save.click()
-	except Exception:
-		driver.execute_script("arguments[0].click();", el_save)
+	_scroll_click(driver, el_save)
 
-	time.sleep(1.0)
-	driver.save_screenshot("screenshots/07_after_save.png")
+	# Saving closes the edit form (the button goes stale) or shows a toast
+	_wait_ready(driver, (EC.staleness_of(el_save),), timeout)
+	_save_screenshot(driver, "07_after_save.png")
 
 
 def parse_args(argv=None):
 	p = argparse.ArgumentParser(description="Automate naukri.com login via OTP (IMAP) and profile update with Selenium")
 	p.add_argument("--headless", action="store_true", help="Run browser in headless mode (Chrome only)")
-	p.add_argument("--timeout", type=int, default=20, help="Explicit wait timeout in seconds")
+	p.add_argument("--timeout", type=int, default=10, help="Explicit wait timeout in seconds")
+	p.add_argument(
+		"--screenshots",
+		nargs="?",
+		const="always",
+		choices=["off", "on-error", "always"],
+		default="on-error",
+		help="Screenshot capture: 'off', 'on-error' (one shot of the failure state; default) or 'always' (every step, written by a background thread). Bare --screenshots means 'always'.",
+	)
+	p.add_argument("--user-data-dir", help="Persistent Chrome profile dir so cookies/session survive across runs")
+	p.add_argument("--attach", metavar="HOST:PORT", help="Attach to a running Chrome started with --remote-debugging-port")
+	p.add_argument(
+		"--page-load-strategy",
+		choices=["normal", "eager", "none"],
+		default="eager",
+		help="Chrome pageLoadStrategy; 'normal' is useful when debugging page-load issues",
+	)
 	return p.parse_args(argv)
 
 
 def main(argv=None) -> int:
+	global _SCREENSHOTS_MODE
 	args = parse_args(argv)
 
+	_SCREENSHOTS_MODE = args.screenshots
+	if _SCREENSHOTS_MODE == "always":
+		_SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+		_start_shot_writer()
+
 	# OTP + IMAP flow: reuse NAUKRI_EMAIL as login email and IMAP username; NAUKRI_PASSWORD as IMAP app password
 	login_email = os.getenv("NAUKRI_EMAIL", "")
 	imap_pass = os.getenv("NAUKRI_PASSWORD", "")
@@ -883,15 +1573,21 @@ def main(argv=None) -> int:
 	if os.getenv("GITHUB_ACTIONS", "").lower() == "true":
 		args.headless = True
 
-	click_naukri_login(
-		headless=args.headless,
-		timeout=args.timeout,
-		email=login_email,
-		password=imap_pass,
-		use_google=False,
-		google_email="",
-		google_password="",
-	)
+	try:
+		click_naukri_login(
+			headless=args.headless,
+			timeout=args.timeout,
+			email=login_email,
+			password=imap_pass,
+			use_google=False,
+			google_email="",
+			google_password="",
+			page_load_strategy=args.page_load_strategy,
+			user_data_dir=args.user_data_dir,
+			attach=args.attach,
+		)
+	finally:
+		_drain_shot_writer()
 	return 0
 
 